@@ -207,6 +207,13 @@ def main():
                     evtData = cData.get_event_data(_trk)
                     pump.send_DataFrame(reply, evtData)
                     continue
+                elif request['cmd'] == 'cnt':  # retrieve tracking record counts by type
+                    cData.set_date(request['date'])
+                    cData.set_event(request['evt'])
+                    counts = {trk: len(cData.get_event_data(trk).index) 
+                        for trk in cData.get_event_types()}
+                    pump.pickle_and_send(reply, counts)
+                    continue
                 elif request['cmd'] == 'img':  # retrieve list of image timestamps
                     cData.set_date(request['date'])
                     cData.set_event(request['evt'])
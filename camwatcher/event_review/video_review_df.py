@@ -22,6 +22,10 @@ app = Flask(__name__) # initialize a flask object
 
 cfg = {'datapump': 'tcp://data1:5556'} 
 
+# multipart/x-mixed-replace framing for each streamed JPEG
+FRAME_HEADER = b'--frame\r\nContent-Type: frame/jpeg\r\n\r\n'
+FRAME_TRAILER = b'\r\n'
+
 @app.before_request
 def before_request():
     g.cwFeed = DataFeed(cfg["datapump"])
@@ -68,20 +72,54 @@ def create_tiny_jpeg() -> bytes:
     buffer = simplejpeg.encode_jpeg(pixel)
     return buffer
 
+TINY_JPEG = create_tiny_jpeg()  # placeholder for empty events, encoded once
+
 class TextHelper:
     def __init__(self, camevt) -> None:
         self._textColor = (0, 0, 0)
         self._lineType = cv2.LINE_AA
         self._textType = cv2.FONT_HERSHEY_SIMPLEX
-        self._bboxColors = {}
-        for objid in camevt['objid'].unique():
-            self._bboxColors[objid] = np.random.randint(256, size=3)
+        # Colors are drawn as a single (N,3) block and converted to the tuples
+        # OpenCV expects up front, rather than once per object per frame.
+        objids = camevt['objid'].unique()
+        colors = np.random.randint(256, size=(len(objids), 3)).tolist()
+        self._bboxColors = dict(zip(objids, map(tuple, colors)))
     def putText(self, frame, objid, text, x1, y1, x2, y2):
-        color = tuple(int(x) for x in self._bboxColors[objid])
+        color = self._bboxColors[objid]
         cv2.rectangle(frame, (x1, y1), (x2, y2), color, 2)
         cv2.rectangle(frame, (x1, (y1 - 28)), ((x1 + 110), y1), color, cv2.FILLED)
         cv2.putText(frame, text, (x1 + 5, y1 - 10), self._textType, 0.5, self._textColor, 1, self._lineType)
 
+class TimeStamper:
+    # The timestamp only changes once per second at the displayed resolution, so the
+    # glyphs are rendered once per tag and then painted onto each frame from a mask.
+    def __init__(self, org=(30, 450), color=(0,255,0)) -> None:
+        self._org = org
+        self._color = color
+        self._tag = None
+        self._roi = None
+        self._mask = None
+    def _render(self, tag, shape) -> None:
+        (x, y) = self._org
+        ((w, h), baseline) = cv2.getTextSize(tag, cv2.FONT_HERSHEY_SIMPLEX, 0.5, 1)
+        y1, y2 = max(y - h - 1, 0), min(y + baseline + 1, shape[0])
+        x1, x2 = max(x, 0), min(x + w + 1, shape[1])
+        if y1 < y2 and x1 < x2:
+            canvas = np.zeros((y2 - y1, x2 - x1, 3), dtype=np.uint8)
+            cv2.putText(canvas, tag, (x - x1, y - y1), cv2.FONT_HERSHEY_SIMPLEX, 0.5, self._color, 1)
+            self._roi = (y1, y2, x1, x2)
+            self._mask = canvas.any(axis=2)
+        else:
+            self._roi = None  # timestamp falls outside of the frame
+        self._tag = tag
+    def stamp(self, frame, frame_time) -> None:
+        tag = "{} UTC".format(frame_time.replace(microsecond=0).isoformat())
+        if tag != self._tag:
+            self._render(tag, frame.shape)
+        if self._roi is not None:
+            (y1, y2, x1, x2) = self._roi
+            frame[y1:y2, x1:x2][self._mask] = self._color
+
 def generate_video(date, event, type='trk'):
     _cwFeed = DataFeed(cfg["datapump"])
     _cwEvt = _cwFeed.get_tracking_data(date, event, type)
@@ -90,6 +128,7 @@ def generate_video(date, event, type='trk'):
         if len(image_list) > 0:
             objects = {}                           # object dictionary for holding last known coordinates
             text = TextHelper(_cwEvt)              # select a random color for each distinct object
+            stamper = TimeStamper()                # reusable timestamp overlay
             event_start = _cwEvt.iloc[0].timestamp
             tracker = _cwEvt[:].itertuples()
             trk = next(tracker)
@@ -112,8 +151,7 @@ def generate_video(date, event, type='trk'):
                         objects = {}
 
                 # draw timestamp on image frame
-                tag = "{} UTC".format(frame_time.isoformat())
-                cv2.putText(frame, tag, (30, 450), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0,255,0), 1)
+                stamper.stamp(frame, frame_time)
 
                 # re-encode the frame back into JPEG format
                 #(flag, encodedframe) = cv2.imencode(".jpg", frame)
@@ -126,15 +164,19 @@ def generate_video(date, event, type='trk'):
                     pause = frame_elaps - playback_elaps
                     time.sleep(pause.seconds + pause.microseconds/1000000)
 
-                # yield the output frame in byte format
-                yield(b'--frame\r\nContent-Type: frame/jpeg\r\n\r\n' + 
-                    bytearray(encodedframe) + b'\r\n')
+                # yield the output frame in byte format, as separate chunks to avoid 
+                # copying the encoded image into a newly concatenated buffer
+                yield FRAME_HEADER
+                yield encodedframe
+                yield FRAME_TRAILER
         else:
-            yield(b'--frame\r\nContent-Type: frame/jpeg\r\n\r\n' + 
-                bytearray(create_tiny_jpeg()) + b'\r\n')
+            yield FRAME_HEADER
+            yield TINY_JPEG
+            yield FRAME_TRAILER
     else:
-        yield(b'--frame\r\nContent-Type: frame/jpeg\r\n\r\n' + 
-            bytearray(create_tiny_jpeg()) + b'\r\n')
+        yield FRAME_HEADER
+        yield TINY_JPEG
+        yield FRAME_TRAILER
 
 @app.route("/video_display/<date>/<event>/<type>")
 def video_display(date, event, type):
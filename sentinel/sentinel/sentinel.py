@@ -5,6 +5,7 @@ License: MIT, see the sentinelcam LICENSE for more details.
 """
 
 import asyncio
+import bisect
 import json
 import logging
 import logging.handlers
@@ -13,8 +14,8 @@ import numpy as np
 import pandas as pd
 from ast import literal_eval
 from datetime import datetime
+import mmap
 import multiprocessing
-from multiprocessing import sharedctypes
 import os
 import time
 import threading
@@ -22,6 +23,8 @@ import traceback
 import queue
 import uuid
 import zmq
+from collections import deque, namedtuple, OrderedDict
+from concurrent import futures
 from zmq.asyncio import Context as AsyncContext
 from zmq.log.handlers import PUBHandler
 from sentinelcam.datafeed import DataFeed
@@ -32,14 +35,18 @@ import simplejpeg
 
 CFG = readConfig(os.path.join(os.path.expanduser("~"), "sentinel.yaml"))
 SOCKDIR = CFG["socket_dir"]
+FEEDBACK_BATCH = 64  # task engine messages taken per wakeup of task_feedback()
 
 ctxAsync = AsyncContext.instance()
 ctxBlocking = zmq.Context.shadow(ctxAsync.underlying)
 jobLock = threading.Lock()
-taskFeed = queue.Queue()
+taskFeed = queue.SimpleQueue()  # single consumer, the JobManager thread
 
 taskList = {}  # All JobRequest objects by JobID
 jobList = {}   # Those task requests which should currently be running
+
+# The subset of a JobRequest sent to a task engine, as seen by the child process
+JobView = namedtuple('JobView', ['jobID', 'jobTask', 'eventDate', 'eventID', 'datapump', 'camsize'])
  
 class JobRequest:
     
@@ -53,6 +60,11 @@ class JobRequest:
 
     Status = ["Undefined", "Queued", "Running", "Done", "Failed", "Chained", "Canceled"]
 
+    # Every request is retained in taskList for the job history, keep them compact
+    __slots__ = ('jobID', 'jobTask', 'jobClass', 'jobStatus', 'jobSubmitTime', 'jobStartTime', 'jobEndTime',
+                 'sourceNode', 'dataSink', 'eventDate', 'eventID', 'datapump', 'camsize', 'engine',
+                 'image_cnt', 'image_rate', '_base', '_summary')
+
     def __init__(self, sink, node, date, event, pump, taskname) -> None:
         self.jobID = uuid.uuid1().hex
         self.jobTask = taskname
@@ -70,6 +82,8 @@ class JobRequest:
         self.engine = None
         self.image_cnt = 0
         self.image_rate = 0.0
+        self._base = {'jobid': self.jobID, 'task': self.jobTask, 'from': self.sourceNode, 'sink': self.dataSink}
+        self._summary = None  # final summary, once the job has ended
         logging.info(str(self.start_Message('SUBMIT')))
         with jobLock:
             taskList[self.jobID] = self
@@ -89,9 +103,9 @@ class JobRequest:
         self.image_rate = stats[1]
         logging.info(str(self.stop_Message()))
         with jobLock:
-            if self.jobID in jobList:
-                logging.debug(f"strike jobList[{self.jobID}], status now {JobRequest.Status[status]}")
-                del jobList[self.jobID]
+            struck = jobList.pop(self.jobID, None)
+        if struck is not None:
+            logging.debug(f"strike jobList[{self.jobID}], status now {JobRequest.Status[status]}")
 
     def _timeVals(self) -> tuple:
         # Returns tuple with 3 formatted strings, or None when factor missing
@@ -106,10 +120,7 @@ class JobRequest:
     def start_Message(self, stage) -> str:
         return json.dumps({
             'flag': stage,
-            'jobid': self.jobID,
-            'task': self.jobTask,
-            'from': self.sourceNode,
-            'sink': self.dataSink,
+            **self._base,
             'date': self.eventDate,
             'event': self.eventID
         })
@@ -118,10 +129,7 @@ class JobRequest:
         (start_time, end_time, elapsed_time) = self._timeVals()
         return json.dumps({
             'flag': 'EOJ',
-            'jobid': self.jobID,
-            'task': self.jobTask,
-            'from': self.sourceNode,
-            'sink': self.dataSink,
+            **self._base,
             'pump': self.datapump,
             'date': self.eventDate,
             'event': self.eventID,
@@ -131,8 +139,10 @@ class JobRequest:
         })
 
     def summary_JSON(self) -> str:
+        if self._summary is not None:
+            return self._summary
         (start_time, end_time, elapsed_time) = self._timeVals()
-        return json.dumps({
+        summary = json.dumps({
             'flag': 'JOB',
             'node': self.sourceNode,
             'date': self.eventDate,
@@ -150,33 +160,43 @@ class JobRequest:
             'images': self.image_cnt,
             'rate': self.image_rate
         })
+        if self.jobEndTime is not None:
+            self._summary = summary  # nothing changes after deregisterJOB()
+        return summary
     
     def full_history_report() -> None:
+        # Report from a snapshot, rather than holding the lock while logging
         with jobLock:
-            logging.info("Start of history.")
-            for jobreq in taskList.values():
-                logging.info(jobreq.summary_JSON())
+            history = list(taskList.values())
+        logging.info("Start of history.")
+        for jobreq in history:
+            logging.info(jobreq.summary_JSON())
         logging.info("End of history.")
 
 class RingWire:
     def __init__(self, socketDir, engineName) -> None:
         self._wire = ctxBlocking.socket(zmq.REP)
         self._wire.bind(f"ipc://{socketDir}/{engineName}")
-        self._poller = zmq.Poller()
-        self._poller.register(self._wire, zmq.POLLIN)
+        self._packer = msgpack.Packer()
+        self._unpacker = msgpack.Unpacker(use_list=False)
 
-    def ready(self) -> bool:
-        events = dict(self._poller.poll(0))
-        if self._wire in events:
-            return events[self._wire] == zmq.POLLIN
-        else:
-            return False    
+    def register(self, poller) -> None:
+        poller.register(self._wire, zmq.POLLIN)
+
+    def unregister(self, poller) -> None:
+        poller.unregister(self._wire)
+
+    def ready(self, events) -> bool:
+        # events are the results of a single poll taken over all the ring wires
+        return bool(events.get(self._wire, 0) & zmq.POLLIN)
     
     def recv(self) -> tuple:
-        return msgpack.unpackb(self._wire.recv(), use_list=False)
+        # Every request is a single complete message, one object in and one out
+        self._unpacker.feed(self._wire.recv())
+        return next(self._unpacker)
 
     def send(self, result) -> None:
-        self._wire.send(msgpack.packb(result))
+        self._wire.send(self._packer.pack(result))
 
     def __del__(self) -> None:
         self._wire.close()
@@ -185,8 +205,17 @@ class RingBuffer:
     def __init__(self, wh, length) -> None:
         dtype = np.dtype('uint8')
         shape = (wh[1], wh[0], 3)
+        framesize = shape[0]*shape[1]*shape[2]
         self._length = length
-        self._buffers = [sharedctypes.RawArray('c', shape[0]*shape[1]*shape[2]) for i in range(length)]
+        # A single shared anonymous mapping for the entire ring, inherited by the forked task engine. 
+        # Ask for transparent huge pages, honored when the kernel allows them for shared memory.
+        self._shm = mmap.mmap(-1, framesize*length)
+        if hasattr(mmap, 'MADV_HUGEPAGE'):
+            try:
+                self._shm.madvise(mmap.MADV_HUGEPAGE)
+            except OSError:
+                pass  # EINVAL from kernels built without transparent huge page support
+        self._buffers = [memoryview(self._shm)[i*framesize:(i+1)*framesize] for i in range(length)]
         self._frames = [np.frombuffer(buffer, dtype=dtype).reshape(shape) for buffer in self._buffers]
         self.reset()
     
@@ -207,8 +236,12 @@ class RingBuffer:
     def isFull(self) -> bool:
         return self._count == self._length
 
-    def put(self, frame) -> None:
-        self._frames[self._end][:] = frame[:]  # np.copyto(self._sharedFrame, frame)
+    def stage(self) -> np.ndarray:
+        # Next free frame slot. Producer writes directly into shared memory,
+        # then calls commit() to make the frame available to the child process.
+        return self._frames[self._end]
+
+    def commit(self) -> None:
         self._count += 1
         self._end += 1
         self._end %= self._length
@@ -248,22 +281,18 @@ class JobTasking:
     accelerator : str
         The co-processor configured for this task engine.
 
-    taskQ : multiprocessing.Queue 
-        Used for sending job requests to the task engine.
-
     rawRingbuff : dict
         The image frame ring buffers for this task engine keyed by image size. 
-        The items are a list of shared memory blocks. These are references to
-        a multiprocessing.sharedctypes.RawArray. Each will be redefined as an 
+        The items are a list of shared memory blocks. These are memoryview slices
+        of a shared mmap, one per frame. Each will be redefined as an 
         appropriate NumPy array by the child process. 
     """
 
-    def __init__(self, engineName, pump, taskCFG, accelerator, taskQ, rawRingbuff) -> None:
+    def __init__(self, engineName, pump, taskCFG, accelerator, rawRingbuff) -> None:
         self._engine = engineName
-        self._taskQ = taskQ
         self._rawRingBuffer = rawRingbuff
         self.process = multiprocessing.Process(target=self.taskHost, args=(
-            engineName, pump, taskCFG, accelerator, taskQ, rawRingbuff))
+            engineName, pump, taskCFG, accelerator, rawRingbuff))
         self.process.start()
 
     def terminate(self) -> None:
@@ -272,16 +301,19 @@ class JobTasking:
             self.process.join()
 
     # --------------------------------------------------------------------------------------------------
-    def taskHost(self, engineName, pump, taskCFG, accelerator, taskQ, _ringbuff):
+    def taskHost(self, engineName, pump, taskCFG, accelerator, _ringbuff):
     # --------------------------------------------------------------------------------------------------
         try:
+            packer = msgpack.Packer()                        # reused for every message sent
             taskpump = pump
             feed = DataFeed(taskpump)                        # useful for task-specific datapump access
             ringWire = feed.zmq_context.socket(zmq.REQ)      # IPC signaling for ring buffer control
             publisher = feed.zmq_context.socket(zmq.PUB)     # job result publication
+            taskQ = feed.zmq_context.socket(zmq.PAIR)        # job requests from the JobManager
             ringWire.connect(f"ipc://{SOCKDIR}/{engineName}")
             publisher.bind(f"ipc://{SOCKDIR}/{engineName}.PUB")
-            ringWire.send(msgpack.packb(0))  # send the ready handshake
+            taskQ.connect(f"ipc://{SOCKDIR}/{engineName}.JOB")
+            ringWire.send(packer.pack(0))  # send the ready handshake
             ringbuffers = {}
             for wh in _ringbuff:
                 dtype = np.dtype('uint8')
@@ -298,15 +330,28 @@ class JobTasking:
             self.ringbuff = []
             self.ringctrl = 'full'
             self.trktype = 'trk'
+            cwUpdates = []  # camwatcher updates for the current frame
+
+            def flushUpdates() -> None:
+                # Camwatcher updates are sent once per frame, rather than once per detection
+                if cwUpdates:
+                    publisher.send(packer.pack((TaskEngine.TaskRESULTS, cwUpdates)))
+                    cwUpdates.clear()
+
+            def nextJob() -> JobView:
+                return JobView(**msgpack.unpackb(taskQ.recv(), use_list=False))
 
             def ringStart(frametime, newEvent=None) -> int:
-                self.frame_start = frametime.isoformat()
+                flushUpdates()
+                self.frame_start = frametime.isoformat()  # as published with results
                 self.frame_offset = 0
-                _start_command = (JobManager.ReadSTART, (self.frame_start, newEvent, self.ringctrl, self.trktype))
-                ringWire.send(msgpack.packb(_start_command))
+                # the JobManager receives the start frame as epoch nanoseconds, not a string to parse
+                _startframe = pd.Timestamp(frametime).value
+                _start_command = (JobManager.ReadSTART, (_startframe, newEvent, self.ringctrl, self.trktype))
+                ringWire.send(packer.pack(_start_command))
                 if newEvent:
                     # wait here for confirmation of ring buffer assignment
-                    self.jobreq = taskQ.get()  
+                    self.jobreq = nextJob()
                     if self.jobreq.camsize != self.imagesize and self.jobreq.camsize != (0,0):
                         self.imagesize = self.jobreq.camsize
                         self.ringbuff = ringbuffers[self.imagesize]
@@ -314,8 +359,9 @@ class JobTasking:
                 return bucket
 
             def ringNext() -> int:
+                flushUpdates()
                 self.frame_offset += 1
-                ringWire.send(msgpack.packb((JobManager.ReadNEXT, None)))
+                ringWire.send(packer.pack((JobManager.ReadNEXT, None)))
                 bucket = msgpack.unpackb(ringWire.recv())
                 return bucket
             
@@ -324,148 +370,151 @@ class JobTasking:
 
             def publish(msg, frameref=None, cwUpd=False) -> None:
                 if frameref is not None:
-                    frame = (self.jobreq.jobID, frameref, self.ringctrl, self.frame_start, self.frame_offset)
-                    msg = frame + msg
                     if cwUpd:
-                        cwUpdate = {
-                            "jobid": msg[0],
-                            "refkey": msg[1],
-                            "ringctrl": msg[2],
-                            "start": msg[3],
-                            "offset": msg[4],
-                            "clas": msg[5],
-                            "objid": msg[6],
-                            'rect': [int(msg[7]), int(msg[8]), int(msg[9]), int(msg[10])],
+                        # encoded here, in parallel with other engines, and logged as is by task_feedback()
+                        cwUpdates.append(json.dumps({
+                            "jobid": self.jobreq.jobID,
+                            "refkey": frameref,
+                            "ringctrl": self.ringctrl,
+                            "start": self.frame_start,
+                            "offset": self.frame_offset,
+                            "clas": msg[0],
+                            "objid": msg[1],
+                            'rect': [int(msg[2]), int(msg[3]), int(msg[4]), int(msg[5])],
                             'trktype': self.trktype
-                        }
-                        msg = json.dumps(cwUpdate)
-                envelope = (TaskEngine.TaskSTATUS, msg)
-                publisher.send(msgpack.packb(envelope))
+                        }))
+                        return
+                    msg = (self.jobreq.jobID, frameref, self.ringctrl, self.frame_start, self.frame_offset) + msg
+                flushUpdates()
+                publisher.send(packer.pack((TaskEngine.TaskSTATUS, msg)))
 
             failCnt = 0
             while failCnt < TaskEngine.FAIL_LIMIT:
-                if taskQ.empty():
-                    time.sleep(0.05)
-                else:
-                    self.jobreq = taskQ.get()
-                    eoj_status = TaskEngine.TaskDONE  # assume success
-                    nextTask = None
-                    try:
-                        if self.jobreq.datapump != taskpump:
-                            taskpump = self.jobreq.datapump
-                            feed.zmq_socket.connect(taskpump)
-                        if self.jobreq.eventID and self.jobreq.camsize != self.imagesize:
-                            self.imagesize = self.jobreq.camsize
-                            self.ringbuff = ringbuffers[self.imagesize]
-
-                        # ----------------------------------------------------------------------
-                        #   Task Initialization
-                        # ----------------------------------------------------------------------
-                        taskcfg = taskCFG[self.jobreq.jobTask]
-                        if not self.jobreq.eventID:
-                            trackingData = None
-                        else:
-                            # preload desired tracking set and retrieve starting image
-                            self.trktype = taskcfg['trk_type'] if 'trk_type' in taskcfg else 'trk'
-                            self.ringctrl = taskcfg['ringctrl'] if 'ringctrl' in taskcfg else 'full'
-                            trackingData = feed.get_tracking_data(self.jobreq.eventDate, self.jobreq.eventID, self.trktype)
-                            if self.ringctrl == 'trk':
-                                startframe = trackingData.iloc[0]['timestamp'] 
-                            else:
-                                startframe = feed.get_image_list(self.jobreq.eventDate, self.jobreq.eventID)[0]
-
-                        if 'alias' in taskcfg:
-                            self.jobreq.jobTask = taskcfg['alias']
-                        if 'chain' in taskcfg:
-                            nextTask = taskcfg['chain']
-
-                        task = TaskFactory(self.jobreq, trackingData, feed, taskcfg["config"], accelerator)
-                        # Hang hooks for task references to ring buffer and publisher
-                        task.ringStart = ringStart
-                        task.ringNext = ringNext
-                        task.getRing = getRing
-                        task.publish = publish
-                        startMsg = (TaskEngine.TaskSTARTED, self.jobreq.jobID)
-                        publisher.send(msgpack.packb(startMsg))
-
-                        # ----------------------------------------------------------------------
-                        #   Execute task
-                        # ----------------------------------------------------------------------
-                        if not self.jobreq.eventID:
-                            # ------------------------------------------------------------------------
-                            #   No starting event? No pipeline() loop supported. Have no tracking data, 
-                            #   and no starting frame. Will call the pipeline() once for this task.
-                            # ------------------------------------------------------------------------
-                            task.pipeline(None)
+                self.jobreq = nextJob()
+                eoj_status = TaskEngine.TaskDONE  # assume success
+                nextTask = None
+                try:
+                    if self.jobreq.datapump != taskpump:
+                        taskpump = self.jobreq.datapump
+                        feed.zmq_socket.connect(taskpump)
+                    if self.jobreq.eventID and self.jobreq.camsize != self.imagesize:
+                        self.imagesize = self.jobreq.camsize
+                        self.ringbuff = ringbuffers[self.imagesize]
 
+                    # ----------------------------------------------------------------------
+                    #   Task Initialization
+                    # ----------------------------------------------------------------------
+                    taskcfg = taskCFG[self.jobreq.jobTask]
+                    if not self.jobreq.eventID:
+                        trackingData = None
+                    else:
+                        # preload desired tracking set and retrieve starting image
+                        self.trktype = taskcfg['trk_type'] if 'trk_type' in taskcfg else 'trk'
+                        self.ringctrl = taskcfg['ringctrl'] if 'ringctrl' in taskcfg else 'full'
+                        trackingData = feed.get_tracking_data(self.jobreq.eventDate, self.jobreq.eventID, self.trktype)
+                        if self.ringctrl == 'trk':
+                            startframe = trackingData.iloc[0]['timestamp'] 
                         else:
-                            # ------------------------------------------------------------------------
-                            #   Start the ring buffer
-                            # ------------------------------------------------------------------------
-                            bucket = ringStart(startframe)
-
-                            # ------------------------------------------------------------------------
-                            #   Frame loop for an image pipeline task
-                            # ------------------------------------------------------------------------
-                            while bucket != JobManager.ReadEOF:
-                                if task.pipeline(self.ringbuff[bucket]):
-                                    bucket = ringNext()
-                                else:
-                                    bucket = JobManager.ReadEOF
-
-                        # ----------------------------------------------------------------------
-                        #   Publish final results 
-                        # ----------------------------------------------------------------------
-                        task.finalize()
-
-                        if nextTask and eoj_status == TaskEngine.TaskDONE:
-                            msg = (TaskEngine.TaskCHAIN, (self.jobreq.jobID, nextTask))
-                            publisher.send(msgpack.packb(msg))
-
-                    except (KeyboardInterrupt, SystemExit):
-                        raise
-                    except DataFeed.TrackingSetEmpty as e:
-                        msg = (TaskEngine.TaskERROR, f"No tracking data for ({e.date}, {e.evt}, {e.trk})")
-                        publisher.send(msgpack.packb(msg))
-                        eoj_status = TaskEngine.TaskFAIL
-                    except DataFeed.ImageSetEmpty as e:
-                        msg = (TaskEngine.TaskERROR, f"No images for ({e.date}, {e.evt})")
-                        publisher.send(msgpack.packb(msg))
-                        eoj_status = TaskEngine.TaskFAIL
-                    except KeyError as keyval:
-                        msg = (TaskEngine.TaskERROR, f"taskHost() internal key error '{keyval}'")
-                        publisher.send(msgpack.packb(msg))
-                        eoj_status = TaskEngine.TaskFAIL
-                    except cv2.error as e:
-                        msg = (TaskEngine.TaskERROR, f"OpenCV error, {str(e)}")
-                        publisher.send(msgpack.packb(msg))
-                        eoj_status = TaskEngine.TaskFAIL
-                        failCnt += 1
-                    except Exception as e:
-                        traceback.print_exc()  # see syslog for traceback  
-                        msg = (TaskEngine.TaskERROR, f"taskHost({self.jobreq.eventDate}, {self.jobreq.eventID}), {str(e)}")
-                        publisher.send(msgpack.packb(msg))
-                        eoj_status = TaskEngine.TaskFAIL
-                        failCnt += 1
+                            startframe = feed.get_image_list(self.jobreq.eventDate, self.jobreq.eventID)[0]
+
+                    if 'alias' in taskcfg:
+                        self.jobreq = self.jobreq._replace(jobTask=taskcfg['alias'])
+                    if 'chain' in taskcfg:
+                        nextTask = taskcfg['chain']
+
+                    task = TaskFactory(self.jobreq, trackingData, feed, taskcfg["config"], accelerator)
+                    # Hang hooks for task references to ring buffer and publisher
+                    task.ringStart = ringStart
+                    task.ringNext = ringNext
+                    task.getRing = getRing
+                    task.publish = publish
+                    startMsg = (TaskEngine.TaskSTARTED, self.jobreq.jobID)
+                    publisher.send(packer.pack(startMsg))
+
+                    # ----------------------------------------------------------------------
+                    #   Execute task
+                    # ----------------------------------------------------------------------
+                    if not self.jobreq.eventID:
+                        # ------------------------------------------------------------------------
+                        #   No starting event? No pipeline() loop supported. Have no tracking data, 
+                        #   and no starting frame. Will call the pipeline() once for this task.
+                        # ------------------------------------------------------------------------
+                        task.pipeline(None)
+
                     else:
-                        failCnt = 0
-                    finally:
-                        publisher.send(msgpack.packb((eoj_status, self.jobreq.jobID)))
+                        # ------------------------------------------------------------------------
+                        #   Start the ring buffer
+                        # ------------------------------------------------------------------------
+                        bucket = ringStart(startframe)
+
+                        # ------------------------------------------------------------------------
+                        #   Frame loop for an image pipeline task
+                        # ------------------------------------------------------------------------
+                        # Keep the loop on local names. The ring itself is still read through self.ringbuff,
+                        # since a task which calls ringStart() for another event may switch ring buffers.
+                        _EOF = JobManager.ReadEOF
+                        pipeline = task.pipeline
+                        while bucket != _EOF:
+                            if pipeline(self.ringbuff[bucket]):
+                                bucket = ringNext()
+                            else:
+                                bucket = _EOF
+
+                    # ----------------------------------------------------------------------
+                    #   Publish final results 
+                    # ----------------------------------------------------------------------
+                    task.finalize()
+
+                    if nextTask and eoj_status == TaskEngine.TaskDONE:
+                        msg = (TaskEngine.TaskCHAIN, (self.jobreq.jobID, nextTask))
+                        publisher.send(packer.pack(msg))
+
+                except (KeyboardInterrupt, SystemExit):
+                    raise
+                except DataFeed.TrackingSetEmpty as e:
+                    msg = (TaskEngine.TaskERROR, f"No tracking data for ({e.date}, {e.evt}, {e.trk})")
+                    publisher.send(packer.pack(msg))
+                    eoj_status = TaskEngine.TaskFAIL
+                except DataFeed.ImageSetEmpty as e:
+                    msg = (TaskEngine.TaskERROR, f"No images for ({e.date}, {e.evt})")
+                    publisher.send(packer.pack(msg))
+                    eoj_status = TaskEngine.TaskFAIL
+                except KeyError as keyval:
+                    msg = (TaskEngine.TaskERROR, f"taskHost() internal key error '{keyval}'")
+                    publisher.send(packer.pack(msg))
+                    eoj_status = TaskEngine.TaskFAIL
+                except cv2.error as e:
+                    msg = (TaskEngine.TaskERROR, f"OpenCV error, {str(e)}")
+                    publisher.send(packer.pack(msg))
+                    eoj_status = TaskEngine.TaskFAIL
+                    failCnt += 1
+                except Exception as e:
+                    traceback.print_exc()  # see syslog for traceback  
+                    msg = (TaskEngine.TaskERROR, f"taskHost({self.jobreq.eventDate}, {self.jobreq.eventID}), {str(e)}")
+                    publisher.send(packer.pack(msg))
+                    eoj_status = TaskEngine.TaskFAIL
+                    failCnt += 1
+                else:
+                    failCnt = 0
+                finally:
+                    flushUpdates()
+                    publisher.send(packer.pack((eoj_status, self.jobreq.jobID)))
             
             # Limit on successive failures exceeded
             msg = (TaskEngine.TaskBOMB, f"{engineName}: JobTasking failure limit exceeded.")
-            publisher.send(msgpack.packb(msg))
+            publisher.send(packer.pack(msg))
 
         except (KeyboardInterrupt, SystemExit):
             print(f"JobTasking shutdown {engineName}.")
         except Exception as e:
             msg = (TaskEngine.TaskBOMB, f"{engineName}: JobTasking failure, {str(e)}")
-            publisher.send(msgpack.packb(msg))
+            publisher.send(packer.pack(msg))
             traceback.print_exc()  # see syslog for traceback
         finally:
             feed.close()
             ringWire.close()
             publisher.close()
+            taskQ.close()
         # ----------------------------------------------------------------------
         #                         End of TaskEngine
         # ----------------------------------------------------------------------
@@ -473,6 +522,7 @@ class JobTasking:
 class TaskEngine:
 
     FAIL_LIMIT = 3
+    ALIVE_CHECK = 1.0  # seconds between checks on the child process
 
     TaskSTATUS = 0
     TaskSUBMIT = 1
@@ -483,14 +533,20 @@ class TaskEngine:
     TaskCANCELED = 6
     TaskWARNING = 7
     TaskERROR = 8
+    TaskRESULTS = 9
     TaskBOMB = -1
 
+    # Tags ending a job, and those relayed to the JobManager as a job status update
+    TERMINAL_TAGS = frozenset({TaskDONE, TaskFAIL, TaskCANCELED})
+    FEEDBACK_TAGS = frozenset({TaskSTARTED, TaskDONE, TaskFAIL, TaskCHAIN, TaskCANCELED})
+
     def __init__(self, engineName, config, ringCFG, taskCFG, pump, asyncSUB) -> None:
         self.name = engineName
         self.job_classes = config["classes"]
         self.accelerator = config["accelerator"]
         self.taskCFG = taskCFG
-        self.taskQ = multiprocessing.Queue()
+        self.taskQ = ctxBlocking.socket(zmq.PAIR)
+        self.taskQ.bind(f"ipc://{SOCKDIR}/{engineName}.JOB")
         self.wire = RingWire(SOCKDIR, engineName)
         ringmodel = ringCFG[config["ring_buffers"]]
         ringsetups = [literal_eval(ring) for ring in ringmodel.values()]
@@ -498,11 +554,17 @@ class TaskEngine:
         self.rawBuffers = {wh: self.ringbuffers[wh].bufferList() for wh in self.ringbuffers}
         self.jobreq = None
         self.cursor = None
+        self.prefetch = None    # frame time of the image request in flight
+        self.decoding = None    # Future for the frame being decoded into the ring buffer
+        self.frametimes = None  # (key, frame times) read for the last ring start of the current job
         self.imagesize = (0,0)  # current image size 
         self.ringBuffer = None  # current RingBuffer 
         self.dataFeed = None    # current DataFeed
+        self.datafeeds = {}     # private to this engine, image requests are left in flight
+        self._alive = True
+        self._alive_checked = time.monotonic()
         # Ready to fork() the child subprocess for this task engine:
-        self._engine = JobTasking(engineName, pump, taskCFG, self.accelerator, self.taskQ, self.rawBuffers)
+        self._engine = JobTasking(engineName, pump, taskCFG, self.accelerator, self.rawBuffers)
         # establish handshake with child, connect to result publisher before continuing
         handshake = self.wire.recv()
         asyncSUB.connect(f"ipc://{SOCKDIR}/{engineName}.PUB")
@@ -510,6 +572,11 @@ class TaskEngine:
 
     def getName(self) -> str:
         return self.name
+
+    def setPump(self, pump) -> None:
+        if not pump in self.datafeeds:
+            self.datafeeds[pump] = DataFeed(pump)
+        self.dataFeed = self.datafeeds[pump]
     
     def getClasses(self) -> list:
         return self.job_classes
@@ -525,6 +592,18 @@ class TaskEngine:
         self.jobreq.eventID = evt
         self.jobreq.camsize = wh
 
+    def send_job(self) -> None:
+        # Only the scalars the task engine reads cross the process boundary
+        jreq = self.jobreq
+        self.taskQ.send(msgpack.packb({
+            'jobID': jreq.jobID,
+            'jobTask': jreq.jobTask,
+            'eventDate': jreq.eventDate,
+            'eventID': jreq.eventID,
+            'datapump': jreq.datapump,
+            'camsize': jreq.camsize
+        }))
+
     def start_job(self, jobreq) -> bool:
         confirm_start = True
         if jobreq.eventID and self.imagesize != jobreq.camsize:
@@ -538,14 +617,29 @@ class TaskEngine:
                 confirm_start = False
         if confirm_start:
             logging.debug(f"{jobreq.engine}: starting job {jobreq.jobID}")
+            self.end_feed()
             self.jobreq = jobreq
-            self.taskQ.put(jobreq)
+            self.frametimes = None
+            self.send_job()
             self.task_start = time.time()
             self.image_cnt = 0
         return confirm_start
 
-    def have_request(self) -> bool:
-        return self.wire.ready()
+    def can_feed(self) -> bool:
+        # Has a job, with a decode to collect or a frame to fetch into a ring buffer with room for it
+        return self.jobreq is not None and (self.decoding is not None or 
+            (self.cursor is not None and not self.ringBuffer.isFull()))
+
+    def end_feed(self) -> None:
+        # Drop any frame feed left by the prior job, waiting on a decode that may still be writing to the ring
+        if self.decoding is not None:
+            if not self.decoding.cancel():
+                futures.wait([self.decoding])
+            self.decoding = None
+        self.cursor = None
+
+    def have_request(self, events) -> bool:
+        return self.wire.ready(events)
 
     def get_request(self) -> tuple:
         return self.wire.recv()
@@ -561,13 +655,22 @@ class TaskEngine:
         return round((self.get_image_cnt() / (time.time() - self.task_start)), 2)
 
     def is_alive(self) -> bool:
-        return self._engine.process.is_alive()
+        # Polling the child process is a system call, this is asked on every JobManager pass
+        now = time.monotonic()
+        if now - self._alive_checked >= TaskEngine.ALIVE_CHECK:
+            self._alive = self._engine.process.is_alive()
+            self._alive_checked = now
+        return self._alive
 
     def cancel(self) -> None:
         # TODO: kill the child process here 
         #self.taskFlag.value = TaskEngine.TaskCANCELED
         pass
 
+    def close(self) -> None:
+        # Release the job socket and its ipc endpoint when the engine is dropped
+        self.taskQ.close(linger=0)
+
 class JobManager:
 
     JobSTATUS = 0
@@ -580,15 +683,31 @@ class JobManager:
     ReadEOF = -1
     ReadNOP = 0
 
+    INDEX_CACHE = 8  # dates retained for frame dimension lookups
+    POLL_WAIT = 20   # milliseconds to wait on the ring wires, while tasks run and no frames are being fed
+
+    # Handling order for a batch of task feed entries, engine failures first. All others are 
+    # equal, and keep their order of arrival.
+    PRIORITY = {TaskEngine.TaskBOMB: 0, TaskEngine.TaskFAIL: 1, TaskEngine.TaskCANCELED: 1}
+
     def __init__(self, engineCFG, ringCFG, taskCFG, default_pump, _asyncSUB) -> None:
         self.ondeck = {}
         self.engines = {}
         self.datafeeds = {}
+        self.dimensions = OrderedDict()  # {event: (width, height)} by (pump, date), least recently used first
         for engine in engineCFG:
             self.engines[engine] = TaskEngine(engine, engineCFG[engine], ringCFG, taskCFG, default_pump, _asyncSUB)
             for jobclass in self.engines[engine].getClasses():
                 self.ondeck[jobclass] = None
+        self.pending = {jobclass: deque() for jobclass in self.ondeck}  # queued behind on-deck, by jobclass
+        self.jobclasses = tuple(self.ondeck)  # fixed once the engines are defined
+        self._engine_classes = {name: tuple(eng.getClasses()) for (name, eng) in self.engines.items()}
+        self._poller = zmq.Poller()  # every ring wire, polled once for each pass of the job thread
+        for engine in self.engines.values():
+            engine.wire.register(self._poller)
         self._setPump(default_pump)
+        # At most one frame is decoded for each engine at a time. The GIL is released during the decode.
+        self._decoder = futures.ThreadPoolExecutor(max_workers=max(1, len(self.engines)), thread_name_prefix='decoder')
         self.taskmenu = taskCFG
         self._stop = False
         self._thread = threading.Thread(target=self._jobThread, args=())
@@ -604,7 +723,7 @@ class JobManager:
         logging.debug(f"Release job {jobid}")
         jreq = taskList[jobid]
         jreq.registerJOB(engine)
-        self.engines[engine].dataFeed = self._setPump(jreq.datapump)
+        self.engines[engine].setPump(jreq.datapump)
         if jreq.eventID:
             jreq.camsize = self._getFrameDimensons(jreq)
         if not self.engines[engine].start_job(jreq):
@@ -623,21 +742,32 @@ class JobManager:
                              task)
         chained.camsize = jreq.camsize
         chained.jobClass = self.taskmenu[task]['class']
-        if chained.jobClass in engine.getClasses():
+        if chained.jobClass in self._engine_classes[jreq.engine]:
             task_stats = (engine.get_image_cnt(), engine.get_image_rate())
             jreq.deregisterJOB(TaskEngine.TaskDONE, task_stats)
             chained.registerJOB(jreq.engine)
             if not engine.start_job(chained):
                 chained.deregisterJOB(TaskEngine.TaskFAIL, (0,0))
+        else:
+            # Needs an engine serving another class, queue it up like any other submitted request
+            taskFeed.put((JobManager.JobSUBMIT, chained.jobID))
 
     def _getFrameDimensons(self, jreq) -> tuple:
-        datafeed = self.datafeeds[jreq.datapump]
-        cwIndx = datafeed.get_date_index(jreq.eventDate)
-        trkevt = cwIndx.loc[(cwIndx['event'] == jreq.eventID) & (cwIndx['type'] == 'trk')]
-        if len(trkevt.index) > 0:
-            _camsize = (trkevt.iloc[0].width, trkevt.iloc[0].height)
-        else:
-            _camsize = (0,0)
+        key = (jreq.datapump, jreq.eventDate)
+        evtsizes = self.dimensions.get(key)
+        if evtsizes is None or jreq.eventID not in evtsizes:
+            # Not yet seen, or the event was added to the index since it was last read
+            datafeed = self._setPump(jreq.datapump)
+            cwIndx = datafeed.get_date_index(jreq.eventDate)
+            # rows still being written can be missing their dimensions, leave those events unknown for now
+            trkevts = cwIndx.loc[cwIndx['type'] == 'trk'].dropna(subset=['width', 'height']).drop_duplicates('event')
+            evtsizes = {evt: (int(w), int(h)) for (evt, w, h) in 
+                zip(trkevts['event'], trkevts['width'], trkevts['height'])}
+            self.dimensions[key] = evtsizes
+            if len(self.dimensions) > JobManager.INDEX_CACHE:
+                self.dimensions.popitem(last=False)
+        self.dimensions.move_to_end(key)
+        _camsize = evtsizes.get(jreq.eventID, (0,0))
         logging.debug(f"Learned image dimensions: {_camsize}")
         return _camsize
 
@@ -646,6 +776,10 @@ class JobManager:
         (startframe, _newEvent, _ringctrl, _trktype) = key
         if startframe:
             _valid = True
+        if taskEngine.decoding is not None:
+            # a frame from the prior cursor could still be writing to the ring buffer
+            futures.wait([taskEngine.decoding])
+            taskEngine.decoding = None
         if _newEvent:  
             # When changing events, potentially assign a different ring buffer
             jreq.eventDate = _newEvent[0]
@@ -660,132 +794,199 @@ class JobManager:
                     _camsize = jreq.camsize
                     _valid = False
             taskEngine.newEvent(jreq.eventDate, jreq.eventID, _camsize)
-            taskEngine.taskQ.put(taskEngine.getJobRequest())  # confirm event change readiness with task engine 
+            taskEngine.send_job()  # confirm event change readiness with task engine 
         if not _valid:
             taskEngine.ringBuffer.reset()
             taskEngine.cursor = None
         else:
-            framestart = datetime.fromisoformat(startframe)
-            if _ringctrl == 'full':
-                frametimes = taskEngine.dataFeed.get_image_list(jreq.eventDate, jreq.eventID)
+            framestart = pd.Timestamp(startframe).to_pydatetime()
+            # A task skipping ahead within an event restarts the ring for the same frames, only read them once per job
+            ftkey = (jreq.datapump, jreq.eventDate, jreq.eventID, _ringctrl, _trktype)
+            if taskEngine.frametimes is not None and taskEngine.frametimes[0] == ftkey:
+                frametimes = taskEngine.frametimes[1]
             else:
-                evtData = taskEngine.dataFeed.get_tracking_data(jreq.eventDate, jreq.eventID, _trktype)
-                # When multiple tracking records are present for the same frame, image data should only be read
-                # once. It is task responsibility to internally align tracking data with each image provided.
-                frametimes = [pd.to_datetime(ts) for ts in evtData['timestamp'].unique()]
+                if _ringctrl == 'full':
+                    frametimes = taskEngine.dataFeed.get_image_list(jreq.eventDate, jreq.eventID)
+                else:
+                    evtData = taskEngine.dataFeed.get_tracking_data(jreq.eventDate, jreq.eventID, _trktype)
+                    # When multiple tracking records are present for the same frame, image data should only be read
+                    # once. It is task responsibility to internally align tracking data with each image provided.
+                    frametimes = pd.to_datetime(evtData['timestamp'].unique()).to_pydatetime()
+                taskEngine.frametimes = (ftkey, frametimes)
             taskEngine.ringBuffer.reset()
-            taskEngine.cursor = iter(frametimes)
+            # both are in chronological order, skip ahead to the first frame at or beyond the start
+            taskEngine.cursor = iter(frametimes[bisect.bisect_left(frametimes, framestart):])
             logging.debug(f"_feedStart({key}) frames: {len(frametimes)}, date {jreq.eventDate} evt {jreq.eventID}")
             try:
-                frametime = next(taskEngine.cursor)
-                while frametime < framestart:
-                    frametime = next(taskEngine.cursor)
-                self._get_frame(taskEngine, frametime)
+                self._prefetch(taskEngine, next(taskEngine.cursor))
             except StopIteration:
                 taskEngine.cursor = None
+            except Exception as e:
+                logging.error(f"_feedStart(), abandon cursor, ({jreq.eventDate},{jreq.eventID},{taskEngine.prefetch}): {str(e)}")
+                taskEngine.cursor = None
+            self._await_frame(taskEngine)
 
     def _feedNext(self, taskEngine) -> None:
-        if not taskEngine.ringBuffer.isFull():
-            try:
-                frametime = next(taskEngine.cursor)
-                self._get_frame(taskEngine, frametime)
-            except StopIteration:
-                taskEngine.cursor = None
+        # Only collect an image or decoded frame once it has arrived, never wait on either here
+        if taskEngine.decoding is not None:
+            if taskEngine.decoding.done():
+                self._commit_frame(taskEngine)
+        elif not taskEngine.ringBuffer.isFull() and taskEngine.dataFeed.have_image_jpg():
+            self._get_frame(taskEngine)
+
+    def _await_frame(self, taskEngine) -> None:
+        # For an empty ring buffer. Wait on the next frame, unless the cursor has been exhausted.
+        if taskEngine.decoding is None and taskEngine.cursor:
+            self._get_frame(taskEngine)
+        if taskEngine.decoding is not None:
+            self._commit_frame(taskEngine)
+
+    def _prefetch(self, taskEngine, frametime) -> None:
+        jreq = taskEngine.getJobRequest()
+        taskEngine.prefetch = frametime
+        taskEngine.dataFeed.request_image_jpg(jreq.eventDate, jreq.eventID, frametime)
 
-    def _get_frame(self, taskEngine, frametime) -> None:
+    def _get_frame(self, taskEngine) -> None:
+        # Start decoding the image in flight into the ring buffer, then request the next one. The datapump 
+        # round trip and the decode both overlap with the task pipeline and servicing other engines.
         datafeed = taskEngine.dataFeed
         jreq = taskEngine.getJobRequest()
         try:
-            jpeg = datafeed.get_image_jpg(jreq.eventDate, jreq.eventID, frametime)
-            taskEngine.ringBuffer.put(simplejpeg.decode_jpeg(jpeg, colorspace='BGR'))
+            jpeg = datafeed.poll_image_jpg()
+            taskEngine.decoding = self._decoder.submit(JobManager._decode, jpeg, taskEngine.ringBuffer.stage())
+            self._prefetch(taskEngine, next(taskEngine.cursor))
+        except StopIteration:
+            taskEngine.cursor = None
+        except Exception as e:
+            logging.error(f"_get_frame(), abandon cursor, ({jreq.eventDate},{jreq.eventID},{taskEngine.prefetch}): {str(e)}")
+            taskEngine.cursor = None
+
+    def _commit_frame(self, taskEngine) -> None:
+        # Add the decoded frame to the ring buffer, waits when still in progress
+        jreq = taskEngine.getJobRequest()
+        try:
+            taskEngine.decoding.result()
+            taskEngine.ringBuffer.commit()
         except Exception as e:
-            logging.error(f"_get_frame(), abandon cursor, ({jreq.eventDate},{jreq.eventID},{frametime}): {str(e)}")
+            logging.error(f"_commit_frame(), abandon cursor, ({jreq.eventDate},{jreq.eventID}): {str(e)}")
             taskEngine.cursor = None
+        taskEngine.decoding = None
+
+    @staticmethod
+    def _decode(jpeg, slot) -> None:
+        frame = simplejpeg.decode_jpeg(jpeg, colorspace='BGR', buffer=slot)
+        if frame.shape != slot.shape:
+            raise ValueError(f"image {frame.shape} does not match ring buffer {slot.shape}")
 
     def _ondeck_status(self): # debug helper
-        now_ondeck = {}
-        for c in self.ondeck.keys():
-            if self.ondeck[c] is None:
-                now_ondeck[c] = None
-            else:
-                now_ondeck[c] = self.ondeck[c].jobID
-        return now_ondeck
+        return {c: (jreq.jobID if jreq else None) for (c, jreq) in self.ondeck.items()}
+
+    def _dispatch(self, tag, msg) -> None:
+        # Skip building the debug messages, and the on-deck status, unless they will be logged
+        debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        if debug:
+            logging.debug(f"Job Manager has queue entry {(JobRequest.Status[tag],msg)}")
+        if tag == TaskEngine.TaskSUBMIT:
+            jobreq = taskList[msg]
+            jobreq.jobClass = self.taskmenu[jobreq.jobTask]['class']
+            if jobreq.jobClass in self.ondeck: 
+                if self.ondeck[jobreq.jobClass] is None: 
+                    self.ondeck[jobreq.jobClass] = jobreq
+                else:
+                    self.pending[jobreq.jobClass].append(jobreq)
+        elif tag == TaskEngine.TaskSTARTED:
+            jobreq = taskList[msg]
+            self.ondeck[jobreq.jobClass] = None
+        elif tag == TaskEngine.TaskCHAIN:
+            (jobid, task) = msg
+            jobreq = taskList[jobid]
+            self._chainJob(jobid, task)
+        elif tag in TaskEngine.TERMINAL_TAGS:
+            jobreq = taskList[msg]
+            engine = self.engines.get(jobreq.engine)  # gone, when its TaskBOMB was handled first
+            if engine is not None and engine.jobreq is not None and engine.jobreq.jobID == msg:
+                engine.jobreq = None
+                engine.end_feed()
+                task_stats = (engine.get_image_cnt(), engine.get_image_rate())
+                jobreq.deregisterJOB(tag, task_stats)
+                if debug:
+                    logging.debug(f"Engine {engine.getName()} gone idle.")
+            if self.ondeck[jobreq.jobClass] == jobreq:
+                self.ondeck[jobreq.jobClass] = None
+        elif tag == TaskEngine.TaskBOMB:
+            # TODO: Need an engine restart here 
+            logging.error(f"TaskEngine '{msg}' bombed out.")
+            if msg in self.engines:
+                engine = self.engines.pop(msg)
+                engine.wire.unregister(self._poller)
+                engine.close()
+                if engine.jobreq is not None:
+                    task_stats = (engine.get_image_cnt(), engine.get_image_rate())
+                    engine.jobreq.deregisterJOB(TaskEngine.TaskFAIL, task_stats)
+        else:
+            logging.error(f"Undefined status '{tag}' for job {msg}")
+        if debug:
+            logging.debug(f"Now ondeck {str(self._ondeck_status())}")
 
     def _jobThread(self) -> None:
         logging.debug(f"Job Manager thread started.")
+        batch = []
+        runningTasks = 0
         while not self._stop:
-            # Have a task start request or job status update?
-            if not taskFeed.empty():
-                (tag, msg) = taskFeed.get()
-                logging.debug(f"Job Manager has queue entry {(JobRequest.Status[tag],msg)}")
-                if tag == TaskEngine.TaskSUBMIT:
-                    jobreq = taskList[msg]
-                    jobreq.jobClass = self.taskmenu[jobreq.jobTask]['class']
-                    if jobreq.jobClass in self.ondeck: 
-                        if self.ondeck[jobreq.jobClass] is None: 
-                            self.ondeck[jobreq.jobClass] = jobreq
-                elif tag == TaskEngine.TaskSTARTED:
-                    jobreq = taskList[msg]
-                    self.ondeck[jobreq.jobClass] = None
-                elif tag == TaskEngine.TaskCHAIN:
-                    (jobid, task) = msg
-                    jobreq = taskList[jobid]
-                    self._chainJob(jobid, task)
-                elif tag in [TaskEngine.TaskDONE,
-                             TaskEngine.TaskFAIL,
-                             TaskEngine.TaskCANCELED]:
-                    jobreq = taskList[msg]
-                    engine = self.engines[jobreq.engine]
-                    if engine.jobreq.jobID == msg:
-                        engine.jobreq = None
-                        task_stats = (engine.get_image_cnt(), engine.get_image_rate())
-                        jobreq.deregisterJOB(tag, task_stats)
-                        logging.debug(f"Engine {engine.getName()} gone idle.")
-                    if self.ondeck[jobreq.jobClass] == jobreq:
-                        self.ondeck[jobreq.jobClass] = None
-                elif tag == TaskEngine.TaskBOMB:
-                    # TODO: Need an engine restart here 
-                    logging.error(f"TaskEngine '{msg}' bombed out.")
-                    if msg in self.engines:
-                        del self.engines[msg]
-                else:
-                    logging.error(f"Undefined status '{tag}' for job {msg}")
-                taskFeed.task_done()
-                logging.debug(f"Now ondeck {str(self._ondeck_status())}")
-            
-            # Service the ring buffers for running tasks.
+            # Have task start requests or job status updates? Take all that are waiting before servicing engines.
+            while True:
+                try:
+                    batch.append(taskFeed.get_nowait())
+                except queue.Empty:
+                    break
+            for (tag, msg) in sorted(batch, key=lambda entry: JobManager.PRIORITY.get(entry[0], 2)):
+                self._dispatch(tag, msg)
+            batch = []
+
+            # Service the ring buffers for running tasks. Take one poll over all the ring wires. When tasks were 
+            # running on the last pass with no frames to feed, wait on it rather than spinning. A ring request 
+            # still wakes the thread at once, task feed entries are picked up within POLL_WAIT.
+            feeding = any(engine.can_feed() for engine in self.engines.values())
+            events = dict(self._poller.poll(JobManager.POLL_WAIT if runningTasks and not feeding else 0))
             runningTasks = 0
-            for engineName in self.engines:
-                engine = self.engines[engineName]
+            dead = []
+            for (engineName, engine) in self.engines.items():
                 if engine.is_alive():
                     if engine.getJobID() is not None:
                         runningTasks += 1
-                        if engine.have_request():
+                        if engine.have_request(events):
                             (cmd, key) = engine.get_request()
                             if cmd == JobManager.ReadSTART:
                                 self._feedStart(engine, key)
                                 engine.send_response(engine.ringBuffer.get())
                             elif cmd == JobManager.ReadNEXT:
                                 engine.ringBuffer.frame_complete()
+                                if engine.ringBuffer.isEmpty():
+                                    self._await_frame(engine)
                                 engine.send_response(engine.ringBuffer.get())
-                        elif engine.cursor:
+                        elif engine.can_feed():
                             self._feedNext(engine)
                 else:
                     # TODO: Need an engine restart here 
                     logging.error(f"TaskEngine '{engineName}' found dead.")
-                    del self.engines[engineName]
+                    dead.append(engineName)
+            for engineName in dead:
+                engine = self.engines.pop(engineName)
+                engine.wire.unregister(self._poller)
+                engine.close()
 
             if runningTasks < len(self.engines):
                 # Have available capacity, what's on-deck by jobclass?
-                for engine in self.engines.items():
-                    if engine[1].getJobID() is None:
-                        for jobclass in engine[1].getClasses():
+                for (name, eng) in self.engines.items():
+                    if eng.getJobID() is None:
+                        for jobclass in self._engine_classes[name]:
                             if self.ondeck[jobclass] is not None:
                                 jreq = self.ondeck[jobclass]
-                                # confirm that another engine has not already been assigned this request
-                                if jreq.jobID not in [taskengine.getJobID() for taskengine in self.engines.values()]:
+                                # confirm that another engine has not already been assigned this request, 
+                                # releasing the job marks it running until its TaskSTARTED clears on-deck
+                                if jreq.jobStatus == JobRequest.Status_QUEUED:
                                     logging.debug(f"Found on deck for class {jobclass}: {jreq.jobID}")
-                                    self._releaseJob(jreq.jobID, engine[0])
+                                    self._releaseJob(jreq.jobID, name)
                                     break
                 # Assign next pending job request to any open on-deck matching class. Ventilation goes here. 
                 # TODO: When running in real-time, need to implement a priority based on the event start time 
@@ -798,22 +999,28 @@ class JobManager:
                 # understanding of what just occured. Each view could be producing requests for the same event as 
                 # action progresses from one view to another. Alternatively, they could be completely unrelated, 
                 # where distinct events are being simultaneously captured from one or more non-adjacent views.
-                for jobclass in self.ondeck:
-                    if self.ondeck[jobclass] is None:
-                        with jobLock:
-                            pending = [r.jobID for r in taskList.values() 
-                                if r.jobStatus == JobRequest.Status_QUEUED and r.jobClass == jobclass]
-                        if len(pending) > 0:
-                            logging.debug(f"Queue up for ondeck, class {jobclass}: {pending[0]}")
-                            taskFeed.put((TaskEngine.TaskSUBMIT, pending[0]))
-
-            if taskFeed.empty() and runningTasks == 0:
-                # nothing currently running or waiting to run
-                time.sleep(0.05)
+                for jobclass in self.jobclasses:
+                    pending = self.pending[jobclass]
+                    while pending and self.ondeck[jobclass] is None:
+                        jreq = pending.popleft()
+                        if jreq.jobStatus == JobRequest.Status_QUEUED:
+                            logging.debug(f"Queue up for ondeck, class {jobclass}: {jreq.jobID}")
+                            self.ondeck[jobclass] = jreq
+
+            if runningTasks == 0:
+                # Nothing currently running. Rather than polling, wait on the task feed, waking as soon as an
+                # entry arrives. Only briefly with a job on deck, it is released on the next pass.
+                try:
+                    batch.append(taskFeed.get(timeout=0.05 if any(self.ondeck.values()) else 1.0))
+                except queue.Empty:
+                    pass
 
     def close(self):
         self._stop = True
         self._thread.join()
+        self._decoder.shutdown()
+        for engine in self.engines.values():
+            engine.close()
 
 async def task_loop(asyncREP, taskCFG):
     logging.debug("Sentinel control loop started.")
@@ -864,30 +1071,40 @@ async def task_loop(asyncREP, taskCFG):
             await asyncREP.send(reply.encode("ascii"))
 
 async def task_feedback(asyncSUB):
+    unpacker = msgpack.Unpacker(use_list=False)
     while True:
-        payload = await asyncSUB.recv()
-        (msgTag, taskMsg) = msgpack.unpackb(payload, use_list=False)
-        if msgTag == TaskEngine.TaskSTATUS:
-            logging.info(str(taskMsg))
-        else: 
-            # These TaskEngine conditions have an equivalent mapping to JobRequest status flags
-            if msgTag in [TaskEngine.TaskSTARTED,
-                          TaskEngine.TaskDONE,
-                          TaskEngine.TaskFAIL,
-                          TaskEngine.TaskCHAIN,
-                          TaskEngine.TaskCANCELED]:
-                logging.debug(f"{taskMsg}: status update {JobRequest.Status[msgTag]}.")
-                taskFeed.put((msgTag, taskMsg))
-            elif msgTag == TaskEngine.TaskWARNING:
-                logging.warning(str(taskMsg))
-            elif msgTag == TaskEngine.TaskERROR:
-                logging.error(str(taskMsg))
-            elif msgTag == TaskEngine.TaskBOMB:
-                msg = taskMsg.split(':')
-                taskFeed.put(msgTag, msg[0])
-                logging.critical(f"TaskEngine {taskMsg} failure.")
-            else:
-                logging.error(f"Unsupported task message: {msgTag}")
+        unpacker.feed(await asyncSUB.recv())
+        # Take the other messages already waiting before yielding to the event loop, up to a limit so the 
+        # control socket is still served. Each payload is one complete message, unpacked in order of arrival.
+        for _ in range(FEEDBACK_BATCH):
+            try:
+                unpacker.feed(await asyncSUB.recv(zmq.NOBLOCK))
+            except zmq.Again:
+                break
+        for (msgTag, taskMsg) in unpacker:
+            # Message text is formatted by logging, only when the record is emitted
+            if msgTag == TaskEngine.TaskSTATUS:
+                logging.info("%s", taskMsg)
+            elif msgTag == TaskEngine.TaskRESULTS:
+                # camwatcher updates for a frame, already JSON text, parsed from the sentinel log
+                for cwUpdate in taskMsg:
+                    logging.info(cwUpdate)
+            else: 
+                # These TaskEngine conditions have an equivalent mapping to JobRequest status flags
+                if msgTag in TaskEngine.FEEDBACK_TAGS:
+                    if logging.getLogger().isEnabledFor(logging.DEBUG):
+                        logging.debug("%s: status update %s.", taskMsg, JobRequest.Status[msgTag])
+                    taskFeed.put((msgTag, taskMsg))
+                elif msgTag == TaskEngine.TaskWARNING:
+                    logging.warning("%s", taskMsg)
+                elif msgTag == TaskEngine.TaskERROR:
+                    logging.error("%s", taskMsg)
+                elif msgTag == TaskEngine.TaskBOMB:
+                    msg = taskMsg.split(':')
+                    taskFeed.put((msgTag, msg[0]))
+                    logging.critical(f"TaskEngine {taskMsg} failure.")
+                else:
+                    logging.error(f"Unsupported task message: {msgTag}")
 
 async def main():
     log = start_logging(CFG["logging_port"])
@@ -246,7 +246,7 @@ class FaceSweep(Task):
             for consider in trkdata.loc[trkdata['usable'] == '*'].itertuples():
                 image = cv2.imdecode(np.frombuffer(
                     self.feed.get_image_jpg(self.taskDate, sweepchk.event, consider.timestamp), 
-                    dtype='uint8'), -1)                    
+                    dtype=np.uint8), cv2.IMREAD_COLOR)                    
                 x1, y1, x2, y2 = consider.rect_x1, consider.rect_y1, consider.rect_x2, consider.rect_y2
                 if x1<0:x1=0
                 if y1<0:y1=0
@@ -308,7 +308,7 @@ class FaceDataUpdate(Task):
                 for r in updates[:].itertuples():
                     image = cv2.imdecode(np.frombuffer(
                         self.feed.get_image_jpg(r.date, r.event, r.timestamp), 
-                        dtype='uint8'), -1)
+                        dtype=np.uint8), cv2.IMREAD_COLOR)
                     ((x1, y1, x2, y2), facemarks) = self.facelist.format_facemarks(r)
                     if y1 < 0: y1 = 0 
                     if x1 < 0: x1 = 0 
@@ -348,13 +348,16 @@ class DailyCleanup(Task):
         if trk_cnt:
             face_ratio = faces_cnt / trk_cnt
             if face_ratio > self.face_ratio_cutoff: 
-                trk_evts = cwIndx.loc[cwIndx['type'] == 'trk']['event'].to_list()
-                face_evts = cwIndx.loc[cwIndx['type'] == 'fd1']['event'].to_list()
-                recon_evts = cwIndx.loc[cwIndx['type'] == 'fr1']['event'].to_list()
+                # Group the event list by tracking type in a single pass over the index
+                evts = cwIndx.groupby('type', sort=False)['event'].agg(list)
+                trk_evts = evts.get('trk', [])
+                face_evts = evts.get('fd1', [])
+                recon_evts = evts.get('fr1', [])
+                face_set, recon_set = set(face_evts), set(recon_evts)
                 # Purge any events with no detected faces.
-                delete_evts = [e for e in trk_evts if not e in face_evts]
+                delete_evts = [e for e in trk_evts if not e in face_set]
                 # Also include any face events with no recon result.
-                delete_evts.extend([e for e in face_evts if not e in recon_evts])
+                delete_evts.extend([e for e in face_evts if not e in recon_set])
                 for event in recon_evts:
                     recon = self.dataFeed.get_tracking_data(self.event_date, event, 'fr1')
                     recon['proba'] = recon.apply(lambda x: float(str(x['classname']).split()[1][:-1])/100, axis=1)
@@ -370,11 +373,11 @@ class DailyCleanup(Task):
                 if self.performing_deletes:
                     for event in delete_evts: self.dataFeed.delete_event(self.event_date, event)
                 else:
+                    evt_starts = cwIndx.groupby('event')['timestamp'].min()
                     for event in delete_evts:
-                        trkrs = cwIndx.loc[cwIndx['event'] == event]['type'].to_list()
-                        started = cwIndx.loc[cwIndx['event'] == event]['timestamp'].min()
+                        started = evt_starts[event]
                         imgs = self.dataFeed.get_image_list(self.event_date, event)
-                        setlen = {trk: len(self.dataFeed.get_tracking_data(self.event_date, event, trk).index) for trk in trkrs}
+                        setlen = self.dataFeed.get_tracking_counts(self.event_date, event)
                         self.publish(f"DailyCleanup, [{event}] {started}, imgs: {len(imgs):3} trkrs: {setlen}")
                 stats = f"DailyCleanup {self.event_date}, trk: {trk_cnt}, fd1: {faces_cnt}, fr1: {len(recon_evts)}, to delete: {len(delete_evts)} ({self.performing_deletes})"
             else:
@@ -398,6 +401,7 @@ class DiskMonitor(Task):
                 cwIndx = self.feed.get_date_index(evtDate)
                 trkrs = cwIndx.loc[cwIndx['type'] == 'trk']
                 if len(trkrs.index) > 0:
+                    evtTypes = cwIndx.groupby('event')['type'].agg(list)
                     for evt in trkrs[:].itertuples():
                         event = evt.event
                         node = evt.node
@@ -405,10 +409,8 @@ class DiskMonitor(Task):
                         imgs = self.feed.get_image_list(evtDate, event)
                         evt_time, objcnt, persons, tails, tail_time = 0, 0, 0, 0, 0
                         if len(imgs) > 0:
-                            evtData = cwIndx.loc[cwIndx['event'] == evt]
-                            evtelaps = imgs[-1]-imgs[0]
-                            evt_time = round(evtelaps.seconds + evtelaps.microseconds/100000,2)
-                            trkTypes = [t for t in evtData['type']]
+                            evt_time = round((imgs[-1] - imgs[0]).total_seconds(), 2)
+                            trkTypes = evtTypes[event]
                             # TODO: Need a full analysis of event data by date. For now,
                             # just focusing on "person" detections. Looking to trim the 
                             # tail end of the image captures beyond the last detection.
@@ -423,8 +425,7 @@ class DiskMonitor(Task):
                                     tailend = [t for t in imgs if t > lastTrk]
                                     tails = len(tailend)
                                     if tails > 0:
-                                        tailelaps = tailend[-1]-tailend[0]
-                                        tail_time = round(tailelaps.seconds + tailelaps.microseconds/100000,2)
+                                        tail_time = round((tailend[-1] - tailend[0]).total_seconds(), 2)
                                         result = dateTag + (event, node, view, len(imgs), evt_time, len(trkTypes), 
                                                             objcnt, personcnt, tails, round(tails/len(imgs)*100,2), tail_time) 
                                         self.publish(result)
@@ -479,8 +480,9 @@ class CollectImageSizes(Task):
                             try:
                                 jpeg = self.feed.get_image_jpg(evtDate, event, imgs[0])
                                 if jpeg is not None:
-                                    frame = simplejpeg.decode_jpeg(jpeg, colorspace='BGR')
-                                    imgSize = (frame.shape[1], frame.shape[0])
+                                    # only the frame header is needed for the size
+                                    (height, width, _, _) = simplejpeg.decode_jpeg_header(jpeg)
+                                    imgSize = (width, height)
                                     result = dateTag + (event, imgSize, node, view, len(imgs))
                                 else:
                                     result = dateTag + (event, (-1,-1), node, view, len(imgs), "unable to retrieve image")
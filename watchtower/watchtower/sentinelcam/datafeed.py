@@ -111,6 +111,7 @@ class DataFeed(imagezmq.ImageSender):
     IMG_LST = 3
     IMG_JPG = 4
     DEL_EVT = 5
+    TRK_CNT = 6
     HEALTH = -1
 
     def __init__(self, connect_to, timeout=15.0):
@@ -124,13 +125,21 @@ class DataFeed(imagezmq.ImageSender):
             DataFeed.IMG_LST: self.recv_pickle,
             DataFeed.IMG_JPG: self.recv_jpg,
             DataFeed.DEL_EVT: self.recv,
+            DataFeed.TRK_CNT: self.recv_pickle,
             DataFeed.HEALTH: self.recv
         }
         self._cmdQ = queue.Queue()
         self._haveResult = threading.Event()
+        self._pending = False
+        self._setSocketOptions()
         self._registerPoller()
         self._startThread()
 
+    def _setSocketOptions(self) -> None:
+        # Never block on close() or context termination with a request still
+        # outstanding, as when abandoning the socket after a datapump timeout.
+        self.zmq_socket.setsockopt(zmq.LINGER, 0)
+
     def _registerPoller(self) -> None:
         self._poller = zmq.Poller()
         self._poller.register(self.zmq_socket, zmq.POLLIN)
@@ -164,20 +173,34 @@ class DataFeed(imagezmq.ImageSender):
                     break
         self.zmq_socket.close()
 
-    def pump_action(self, cmd, request) -> object:
+    def _pump_request(self, cmd, request) -> None:
+        if self._pending:
+            try:
+                self._pump_result()  # discard any unclaimed result
+            except TimeoutError:
+                pass  # connection was reset, carry on with this request
         self._haveResult.clear()
         self._cmdQ.put((cmd, request))
+        self._pending = True
+
+    def _pump_result(self) -> object:
         flag = self._haveResult.wait(timeout=self._timeout)
+        self._pending = False
         if not flag: # shutdown thread and attempt recovery
             self._happy = False
             timedout = f"Timed out reading from datapump {self._pump}"
             logging.error(timedout)
             self.init_reqrep(self._pump)
+            self._setSocketOptions()
             self._registerPoller()
             self._startThread()            
             raise TimeoutError(timedout)
         return self._data
 
+    def pump_action(self, cmd, request) -> object:
+        self._pump_request(cmd, request)
+        return self._pump_result()
+
     def get_date_list(self) -> list:
         return self.pump_action(DataFeed.DATE_LST, {'cmd': 'dat'})
 
@@ -192,6 +215,10 @@ class DataFeed(imagezmq.ImageSender):
             raise DataFeed.TrackingSetEmpty(date, event, type)
         return result
 
+    def get_tracking_counts(self, date, event) -> dict:
+        request = {'cmd': 'cnt', 'date': date, 'evt': event}
+        return self.pump_action(DataFeed.TRK_CNT, request)
+
     def get_image_list(self, date, event) -> list:
         request = {'cmd': 'img', 'date': date, 'evt': event}
         result = self.pump_action(DataFeed.IMG_LST, request)
@@ -199,13 +226,28 @@ class DataFeed(imagezmq.ImageSender):
             raise DataFeed.ImageSetEmpty(date, event)
         return result
 
-    def get_image_jpg(self, date, event, frametime) -> bytes:
+    def _image_request(self, date, event, frametime) -> dict:
         dt = frametime.isoformat()
-        request = {'cmd': 'pic', 'date': date, 'evt': event,
-                   'frametime': "{}_{}".format(dt[:10], dt[11:].replace(':','.'))}
+        return {'cmd': 'pic', 'date': date, 'evt': event,
+                'frametime': "{}_{}".format(dt[:10], dt[11:].replace(':','.'))}
+
+    def get_image_jpg(self, date, event, frametime) -> bytes:
+        request = self._image_request(date, event, frametime)
         result = self.pump_action(DataFeed.IMG_JPG, request)
         return result
 
+    def request_image_jpg(self, date, event, frametime) -> None:
+        # Starts retrieval of an image without waiting on it, see poll_image_jpg()
+        request = self._image_request(date, event, frametime)
+        self._pump_request(DataFeed.IMG_JPG, request)
+
+    def have_image_jpg(self) -> bool:
+        return self._pending and self._haveResult.is_set()
+
+    def poll_image_jpg(self) -> bytes:
+        # Result of the preceding request_image_jpg(), waits when still in flight
+        return self._pump_result()
+
     def delete_event(self, date, event) -> str:
         request = {'cmd': 'del', 'date': date, 'evt': event}
         return self.pump_action(DataFeed.DEL_EVT, request)
@@ -217,23 +259,37 @@ class DataFeed(imagezmq.ImageSender):
 
 class EventList:
     def __init__(self, feed, date1=datetime.now().isoformat()[:10], event=None, filename=None, date2=None, trk='trk') -> None:
-        self.eventList = []
-        if filename:
-            with open(filename) as evtfile:
-                self.eventList = [tuple(evtkey.split()[:2]) for evtkey in evtfile]
+        self._feed = feed
+        self._date1 = date1
+        self._date2 = date2
+        self._event = event
+        self._filename = filename
+        self._trk = trk
+        self.eventList = list(self.iter_events())
+
+    def iter_events(self):
+        # Yields (date, event) keys again from the source, fetching each date index only as it is reached
+        if self._filename:
+            with open(self._filename) as evtfile:
+                for evtkey in evtfile:
+                    yield tuple(evtkey.split()[:2])
         else:
-            if date2:
-                datelist = [d for d in feed.get_date_list() if d >= date1 and d <= date2]
+            if self._date2:
+                datelist = [d for d in self._feed.get_date_list() if d >= self._date1 and d <= self._date2]
             else:
-                datelist = [date1]
+                datelist = [self._date1]
             for day in datelist:
-                if event:
-                    self.eventList.append((day, event))
+                if self._event:
+                    yield (day, self._event)
                     break
-                cwIndx = feed.get_date_index(day)
-                event_set = cwIndx.loc[cwIndx['type'] == trk]['event'].to_list()
-                for evt in event_set:
-                    self.eventList.append((day, evt))
+                cwIndx = self._feed.get_date_index(day)
+                for evt in cwIndx.loc[cwIndx['type'] == self._trk]['event'].to_list():
+                    yield (day, evt)
+
+    @classmethod
+    def from_file(cls, filename) -> "EventList":
+        # Event keys are read from the file, no DataFeed connection required
+        return cls(None, filename=filename)
 
     def get_event_list(self):
         return self.eventList